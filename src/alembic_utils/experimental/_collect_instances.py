@@ -1,11 +1,8 @@
 import importlib
 import os
-from pathlib import Path
 from types import ModuleType
 from typing import Generator, List, Type, TypeVar
 
-from flupy import walk_files
-
 T = TypeVar("T")
 
 
@@ -24,28 +21,24 @@ def walk_modules(module: ModuleType) -> Generator[ModuleType, None, None]:
         # ...
     """
     top_module = module
-    top_path = top_module.__path__[0]  # type: ignore
-
-    directories = (
-        walk_files(str(top_path))
-        .filter(lambda x: x.endswith(".py"))
-        .map(Path)
-        .group_by(lambda x: x.parent)
-        .map(lambda x: (x[0], x[1].collect()))
-    )
-
-    for base_path, files in directories:
-        if str(base_path / "__init__.py") in [str(x) for x in files]:
-            for module_path in files:
-                if "__init__.py" not in str(module_path):
-
-                    # Example: elt.settings
-                    module_import_path = str(module_path)[
-                        len(str(top_path)) - len(top_module.__name__) :
-                    ].replace(os.path.sep, ".")[:-3]
-
-                    module = importlib.import_module(module_import_path)
-                    yield module
+    top_path = str(top_module.__path__[0])  # type: ignore
+
+    # os.walk is built on os.scandir, so directory entries are discovered without
+    # an extra stat() per file
+    for base_path, _, file_names in os.walk(top_path):
+        if "__init__.py" not in file_names:
+            # Not a package, contents are not importable
+            continue
+
+        for file_name in file_names:
+            if file_name.endswith(".py") and file_name != "__init__.py":
+
+                # Example: elt.settings
+                module_import_path = os.path.join(base_path, file_name)[
+                    len(top_path) - len(top_module.__name__) :
+                ].replace(os.path.sep, ".")[:-3]
+
+                yield importlib.import_module(module_import_path)
 
 
 def collect_instances(module: ModuleType, class_: Type[T]) -> List[T]:
@@ -1,6 +1,7 @@
 # pylint: disable=unused-argument,invalid-name,line-too-long
 
 
+import sys
 from typing import Generator
 
 from sqlalchemy import text as sql_text
@@ -9,6 +10,21 @@ from sqlalchemy.sql.elements import TextClause
 from alembic_utils.replaceable_entity import ReplaceableEntity
 from alembic_utils.statement import coerce_to_unquoted, normalize_whitespace
 
+_EXTENSIONS_SQL = sql_text(
+    """
+select
+    np.nspname schema_name,
+    ext.extname extension_name
+from
+    pg_extension ext
+    join pg_namespace np
+        on ext.extnamespace = np.oid
+where
+    np.nspname not in ('pg_catalog')
+    and np.nspname like :schema;
+"""
+)
+
 
 class PGExtension(ReplaceableEntity):
     """A PostgreSQL Extension compatible with `alembic revision --autogenerate`
@@ -22,8 +38,8 @@ class PGExtension(ReplaceableEntity):
     type_ = "extension"
 
     def __init__(self, schema: str, signature: str):
-        self.schema: str = coerce_to_unquoted(normalize_whitespace(schema))
-        self.signature: str = coerce_to_unquoted(normalize_whitespace(signature))
+        self.schema: str = sys.intern(coerce_to_unquoted(normalize_whitespace(schema)))
+        self.signature: str = sys.intern(coerce_to_unquoted(normalize_whitespace(signature)))
         # Include schema in definition since extensions can only exist once per
         # database and we want to detect schema changes and emit alter schema
         self.definition: str = f"{self.__class__.__name__}: {self.schema} {self.signature}"
@@ -61,20 +77,6 @@ class PGExtension(ReplaceableEntity):
     @classmethod
     def from_database(cls, sess, schema):
         """Get a list of all extensions defined in the db"""
-        sql = sql_text(
-            f"""
-        select
-            np.nspname schema_name,
-            ext.extname extension_name
-        from
-            pg_extension ext
-            join pg_namespace np
-                on ext.extnamespace = np.oid
-        where
-            np.nspname not in ('pg_catalog')
-            and np.nspname like :schema;
-        """
-        )
-        rows = sess.execute(sql, {"schema": schema}).fetchall()
+        rows = sess.execute(_EXTENSIONS_SQL, {"schema": schema})
         db_exts = [PGExtension(x[0], x[1]) for x in rows]
         return db_exts
@@ -1,8 +1,11 @@
 # pylint: disable=unused-argument,invalid-name,line-too-long
-from typing import List
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from parse import parse
 from sqlalchemy import text as sql_text
+from sqlalchemy.sql.elements import TextClause
 
 from alembic_utils.exceptions import SQLParseFailure
 from alembic_utils.replaceable_entity import ReplaceableEntity
@@ -13,6 +16,80 @@ from alembic_utils.statement import (
     strip_terminating_semicolon,
 )
 
+_SERVER_VERSION_SQL = sql_text("show server_version_num")
+
+# Prior to postgres 11, pg_proc had different columns
+# https://github.com/olirice/alembic_utils/issues/12
+_FUNCTIONS_BASE_SQL = """
+    with extension_functions as (
+        select
+            objid as extension_function_oid
+        from
+            pg_depend
+        where
+            -- depends on an extension
+            deptype='e'
+            -- is a proc/function
+            and classid = 'pg_proc'::regclass
+    )
+
+    select
+        case
+            when l.lanname = 'internal' then p.prosrc
+            else pg_get_functiondef(p.oid)
+        end as create_statement
+    from
+        pg_proc p
+        left join pg_namespace n on p.pronamespace = n.oid
+        left join pg_language l on p.prolang = l.oid
+        left join extension_functions ef on p.oid = ef.extension_function_oid
+    where
+        n.nspname not in ('pg_catalog', 'information_schema')
+        -- Filter out functions from extensions
+        and ef.extension_function_oid is null
+        and n.nspname = :schema
+"""
+
+_FUNCTIONS_SQL_PG_GTE_11 = sql_text(
+    _FUNCTIONS_BASE_SQL
+    + """
+        and p.prokind = 'f'
+    """
+)
+
+_FUNCTIONS_SQL_PG_LT_11 = sql_text(
+    _FUNCTIONS_BASE_SQL
+    + """
+        and not p.proisagg
+        and not p.proiswindow
+    """
+)
+
+# Faster precompiled equivalent of the parse template
+# "create{}function{:s}{schema}.{signature}{:s}returns{:s}{definition}"
+_CREATE_FUNCTION_PATTERN = re.compile(
+    r"create\s+(?:or\s+replace\s+)?function\s+(?P<schema>\S+?)\.(?P<signature>.+?)\s+returns\s+(?P<definition>.+)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_create_function(sql: str) -> Optional[Tuple[str, str, str]]:
+    """Parse a "create function" statement into (schema, signature, definition)
+
+    Cached so identical statements, e.g. repeated catalog fetches during
+    autogenerate, are parsed once
+    """
+    result = _CREATE_FUNCTION_PATTERN.match(sql.strip())
+    if result is None:
+        return None
+    # remove possible quotes from signature
+    raw_signature = result["signature"]
+    signature = (
+        "".join(raw_signature.split('"', 2)) if raw_signature.startswith('"') else raw_signature
+    )
+    return result["schema"], signature, "returns " + result["definition"]
+
 
 class PGFunction(ReplaceableEntity):
     """A PostgreSQL Function compatible with `alembic revision --autogenerate`
@@ -37,21 +114,10 @@ class PGFunction(ReplaceableEntity):
     @classmethod
     def from_sql(cls, sql: str) -> "PGFunction":
         """Create an instance instance from a SQL string"""
-        template = "create{}function{:s}{schema}.{signature}{:s}returns{:s}{definition}"
-        result = parse(template, sql.strip(), case_sensitive=False)
-        if result is not None:
-            # remove possible quotes from signature
-            raw_signature = result["signature"]
-            signature = (
-                "".join(raw_signature.split('"', 2))
-                if raw_signature.startswith('"')
-                else raw_signature
-            )
-            return cls(
-                schema=result["schema"],
-                signature=signature,
-                definition="returns " + result["definition"],
-            )
+        parsed = _parse_create_function(sql)
+        if parsed is not None:
+            schema, signature, definition = parsed
+            return cls(schema=schema, signature=signature, definition=definition)
         raise SQLParseFailure(f'Failed to parse SQL into PGFunction """{sql}"""')
 
     @property
@@ -65,103 +131,63 @@ class PGFunction(ReplaceableEntity):
         name, remainder = self.signature.split("(", 1)
         return '"' + name + '"(' + remainder
 
+    # Rendered statements cached per instance; ops and autogenerate may render
+    # the same entity several times
+    _create_statement: Optional[TextClause] = None
+    _replace_statement: Optional[TextClause] = None
+    _drop_statement_base: Optional[str] = None
+
     def to_sql_statement_create(self):
         """ Generates a SQL "create function" statement for PGFunction """
-        return sql_text(
-            f"CREATE FUNCTION {self.literal_schema}.{self.literal_signature} {self.definition}"
-        )
+        if self._create_statement is None:
+            self._create_statement = sql_text(
+                f"CREATE FUNCTION {self.literal_schema}.{self.literal_signature} {self.definition}"
+            )
+        return self._create_statement
 
     def to_sql_statement_drop(self, cascade=False):
         """Generates a SQL "drop function" statement for PGFunction"""
         cascade = "cascade" if cascade else ""
-        template = "{function_name}({parameters})"
-        result = parse(template, self.signature, case_sensitive=False)
-        try:
-            function_name = result["function_name"]
-            parameters_str = result["parameters"].strip()
-        except TypeError:
-            # Did not match, NoneType is not scriptable
-            result = parse("{function_name}()", self.signature, case_sensitive=False)
-            function_name = result["function_name"]
-            parameters_str = ""
-
-        # NOTE: Will fail if a text field has a default and that deafult contains a comma...
-        parameters: List[str] = parameters_str.split(",")
-        parameters = [x[: len(x.lower().split("default")[0])] for x in parameters]
-        parameters = [x.strip() for x in parameters]
-        drop_params = ", ".join(parameters)
-        return sql_text(
-            f'DROP FUNCTION {self.literal_schema}."{function_name}"({drop_params}) {cascade}'
-        )
+        if self._drop_statement_base is None:
+            template = "{function_name}({parameters})"
+            result = parse(template, self.signature, case_sensitive=False)
+            try:
+                function_name = result["function_name"]
+                parameters_str = result["parameters"].strip()
+            except TypeError:
+                # Did not match, NoneType is not scriptable
+                result = parse("{function_name}()", self.signature, case_sensitive=False)
+                function_name = result["function_name"]
+                parameters_str = ""
+
+            # NOTE: Will fail if a text field has a default and that deafult contains a comma...
+            parameters: List[str] = parameters_str.split(",")
+            parameters = [x[: len(x.lower().split("default")[0])] for x in parameters]
+            parameters = [x.strip() for x in parameters]
+            drop_params = ", ".join(parameters)
+            self._drop_statement_base = (
+                f'DROP FUNCTION {self.literal_schema}."{function_name}"({drop_params})'
+            )
+        return sql_text(f"{self._drop_statement_base} {cascade}")
 
     def to_sql_statement_create_or_replace(self):
         """ Generates a SQL "create or replace function" statement for PGFunction """
-        yield sql_text(
-            f"CREATE OR REPLACE FUNCTION {self.literal_schema}.{self.literal_signature} {self.definition}"
-        )
+        if self._replace_statement is None:
+            self._replace_statement = sql_text(
+                f"CREATE OR REPLACE FUNCTION {self.literal_schema}.{self.literal_signature} {self.definition}"
+            )
+        yield self._replace_statement
 
     @classmethod
     def from_database(cls, sess, schema):
         """Get a list of all functions defined in the db"""
 
-        # Prior to postgres 11, pg_proc had different columns
-        # https://github.com/olirice/alembic_utils/issues/12
-        PG_GTE_11 = """
-            and p.prokind = 'f'
-        """
-
-        PG_LT_11 = """
-            and not p.proisagg
-            and not p.proiswindow
-        """
-
         # Retrieve the postgres server version e.g. 90603 for 9.6.3 or 120003 for 12.3
-        pg_version_str = sess.execute(sql_text("show server_version_num")).fetchone()[0]
+        pg_version_str = sess.execute(_SERVER_VERSION_SQL).fetchone()[0]
         pg_version = int(pg_version_str)
 
-        sql = sql_text(
-            f"""
-        with extension_functions as (
-            select
-                objid as extension_function_oid
-            from
-                pg_depend
-            where
-                -- depends on an extension
-                deptype='e'
-                -- is a proc/function
-                and classid = 'pg_proc'::regclass
-        )
-
-        select
-            n.nspname as function_schema,
-            p.proname as function_name,
-            pg_get_function_arguments(p.oid) as function_arguments,
-            case
-                when l.lanname = 'internal' then p.prosrc
-                else pg_get_functiondef(p.oid)
-            end as create_statement,
-            t.typname as return_type,
-            l.lanname as function_language
-        from
-            pg_proc p
-            left join pg_namespace n on p.pronamespace = n.oid
-            left join pg_language l on p.prolang = l.oid
-            left join pg_type t on t.oid = p.prorettype
-            left join extension_functions ef on p.oid = ef.extension_function_oid
-        where
-            n.nspname not in ('pg_catalog', 'information_schema')
-            -- Filter out functions from extensions
-            and ef.extension_function_oid is null
-            and n.nspname = :schema
-        """
-            + (PG_GTE_11 if pg_version >= 110000 else PG_LT_11)
-        )
-
-        rows = sess.execute(sql, {"schema": schema}).fetchall()
-        db_functions = [PGFunction.from_sql(x[3]) for x in rows]
-
-        for func in db_functions:
-            assert func is not None
+        sql = _FUNCTIONS_SQL_PG_GTE_11 if pg_version >= 110000 else _FUNCTIONS_SQL_PG_LT_11
 
-        return db_functions
+        rows = sess.execute(sql, {"schema": schema})
+        # from_sql raises SQLParseFailure on unparseable rows, so no post-validation pass is needed
+        return [PGFunction.from_sql(x[0]) for x in rows]
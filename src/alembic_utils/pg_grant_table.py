@@ -32,6 +32,49 @@ class PGGrantTableChoice(str, Enum):
 
 C = PGGrantTableChoice
 
+_COLUMN_GRANTS_SQL = sql_text(
+    """
+SELECT
+    table_schema as schema,
+    table_name,
+    grantee as role_name,
+    privilege_type as grant_option,
+    is_grantable,
+    column_name
+FROM
+    information_schema.role_column_grants rcg
+    -- Cant revoke from superusers so filter out those recs
+    join pg_roles pr
+        on rcg.grantee = pr.rolname
+WHERE
+    not pr.rolsuper
+    and grantor = CURRENT_USER
+    and table_schema like :schema
+    and privilege_type in ('SELECT', 'INSERT', 'UPDATE', 'REFERENCES')
+"""
+)
+
+_TABLE_GRANTS_SQL = sql_text(
+    """
+SELECT
+    table_schema as schema_name,
+    table_name,
+    grantee as role_name,
+    privilege_type as grant_option,
+    is_grantable
+FROM
+    information_schema.role_table_grants rcg
+    -- Cant revoke from superusers so filter out those recs
+    join pg_roles pr
+        on rcg.grantee = pr.rolname
+WHERE
+    not pr.rolsuper
+    and grantor = CURRENT_USER
+    and table_schema like :schema
+    and privilege_type in ('DELETE', 'TRUNCATE', 'TRIGGER')
+"""
+)
+
 
 @dataclass(frozen=True, eq=True, order=True)
 class SchemaTableRole:
@@ -132,29 +175,7 @@ class PGGrantTable(ReplaceableEntity):
     @classmethod
     def from_database(cls, sess: Session, schema: str = "%"):
         # COLUMN LEVEL
-        sql = sql_text(
-            """
-        SELECT
-            table_schema as schema,
-            table_name,
-            grantee as role_name,
-            privilege_type as grant_option,
-            is_grantable,
-            column_name
-        FROM
-            information_schema.role_column_grants rcg
-            -- Cant revoke from superusers so filter out those recs
-            join pg_roles pr
-                on rcg.grantee = pr.rolname
-        WHERE
-            not pr.rolsuper
-            and grantor = CURRENT_USER
-            and table_schema like :schema
-            and privilege_type in ('SELECT', 'INSERT', 'UPDATE', 'REFERENCES')
-        """
-        )
-
-        rows = sess.execute(sql, params={"schema": schema}).fetchall()
+        rows = sess.execute(_COLUMN_GRANTS_SQL, params={"schema": schema})
         grants = []
 
         grouped = (
@@ -175,28 +196,7 @@ class PGGrantTable(ReplaceableEntity):
             grants.append(grant)
 
         # TABLE LEVEL
-        sql = sql_text(
-            """
-        SELECT
-            table_schema as schema_name,
-            table_name,
-            grantee as role_name,
-            privilege_type as grant_option,
-            is_grantable
-        FROM
-            information_schema.role_table_grants rcg
-            -- Cant revoke from superusers so filter out those recs
-            join pg_roles pr
-                on rcg.grantee = pr.rolname
-        WHERE
-            not pr.rolsuper
-            and grantor = CURRENT_USER
-            and table_schema like :schema
-            and privilege_type in ('DELETE', 'TRUNCATE', 'TRIGGER')
-        """
-        )
-
-        rows = sess.execute(sql, params={"schema": schema}).fetchall()
+        rows = sess.execute(_TABLE_GRANTS_SQL, params={"schema": schema})
 
         for schema_name, table_name, role_name, grant_option, is_grantable in rows:
             grant = PGGrantTable(
@@ -11,6 +11,21 @@ from alembic_utils.exceptions import SQLParseFailure
 from alembic_utils.replaceable_entity import ReplaceableEntity
 from alembic_utils.statement import strip_terminating_semicolon
 
+_MATERIALIZED_VIEWS_SQL = sql_text(
+    """
+select
+    schemaname schema_name,
+    matviewname view_name,
+    definition,
+    ispopulated is_populated
+from
+    pg_matviews
+where
+    schemaname not in ('pg_catalog', 'information_schema')
+    and schemaname::text like :schema;
+"""
+)
+
 
 class PGMaterializedView(ReplaceableEntity):
     """A PostgreSQL Materialized View compatible with `alembic revision --autogenerate`
@@ -112,24 +127,5 @@ class PGMaterializedView(ReplaceableEntity):
     @classmethod
     def from_database(cls, sess, schema):
         """Get a list of all functions defined in the db"""
-        sql = sql_text(
-            f"""
-        select
-            schemaname schema_name,
-            matviewname view_name,
-            definition,
-            ispopulated is_populated
-        from
-            pg_matviews
-        where
-            schemaname not in ('pg_catalog', 'information_schema')
-            and schemaname::text like '{schema}';
-        """
-        )
-        rows = sess.execute(sql).fetchall()
-        db_views = [PGMaterializedView(x[0], x[1], x[2], with_data=x[3]) for x in rows]
-
-        for view in db_views:
-            assert view is not None
-
-        return db_views
+        rows = sess.execute(_MATERIALIZED_VIEWS_SQL, {"schema": schema})
+        return [PGMaterializedView(x[0], x[1], x[2], with_data=x[3]) for x in rows]
@@ -6,6 +6,24 @@ from alembic_utils.on_entity_mixin import OnEntityMixin
 from alembic_utils.replaceable_entity import ReplaceableEntity
 from alembic_utils.statement import coerce_to_quoted
 
+_POLICIES_SQL = sql_text(
+    """
+select
+    schemaname,
+    tablename,
+    policyname,
+    permissive,
+    roles,
+    cmd,
+    qual,
+    with_check
+from
+    pg_policies
+where
+    schemaname = :schema
+"""
+)
+
 
 class PGPolicy(OnEntityMixin, ReplaceableEntity):
     """A PostgreSQL Policy compatible with `alembic revision --autogenerate`
@@ -61,24 +79,7 @@ class PGPolicy(OnEntityMixin, ReplaceableEntity):
     @classmethod
     def from_database(cls, connection, schema):
         """Get a list of all policies defined in the db"""
-        sql = sql_text(
-            f"""
-        select
-            schemaname,
-            tablename,
-            policyname,
-            permissive,
-            roles,
-            cmd,
-            qual,
-            with_check
-        from
-            pg_policies
-        where
-            schemaname = '{schema}'
-        """
-        )
-        rows = connection.execute(sql).fetchall()
+        rows = connection.execute(_POLICIES_SQL, {"schema": schema})
 
         def get_definition(permissive, roles, cmd, qual, with_check):
             definition = ""
@@ -110,7 +111,4 @@ class PGPolicy(OnEntityMixin, ReplaceableEntity):
             )
             db_policies.append(policy)
 
-        for policy in db_policies:
-            assert policy is not None
-
         return db_policies
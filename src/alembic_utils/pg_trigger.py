@@ -7,6 +7,22 @@ from alembic_utils.exceptions import SQLParseFailure
 from alembic_utils.on_entity_mixin import OnEntityMixin
 from alembic_utils.replaceable_entity import ReplaceableEntity
 
+_TRIGGERS_SQL = sql_text(
+    """
+select
+    pc.relnamespace::regnamespace::text as table_schema,
+    tgname trigger_name,
+    pg_get_triggerdef(pgt.oid) definition
+from
+    pg_trigger pgt
+        inner join pg_class pc
+            on pgt.tgrelid = pc.oid
+where
+    not tgisinternal
+    and pc.relnamespace::regnamespace::text like :schema
+"""
+)
+
 
 class PGTrigger(OnEntityMixin, ReplaceableEntity):
     """A PostgreSQL Trigger compatible with `alembic revision --autogenerate`
@@ -144,26 +160,7 @@ class PGTrigger(OnEntityMixin, ReplaceableEntity):
     def from_database(cls, sess, schema):
         """Get a list of all functions defined in the db"""
 
-        sql = sql_text(
-            """
-        select
-            pc.relnamespace::regnamespace::text as table_schema,
-            tgname trigger_name,
-            pg_get_triggerdef(pgt.oid) definition
-        from
-            pg_trigger pgt
-                inner join pg_class pc
-                    on pgt.tgrelid = pc.oid
-        where
-            not tgisinternal
-            and pc.relnamespace::regnamespace::text like :schema
-        """
-        )
-        rows = sess.execute(sql, {"schema": schema}).fetchall()
-
-        db_triggers = [PGTrigger.from_sql(x[2]) for x in rows]
-
-        for trig in db_triggers:
-            assert trig is not None
+        rows = sess.execute(_TRIGGERS_SQL, {"schema": schema})
 
-        return db_triggers
+        # from_sql raises SQLParseFailure on unparseable rows, so no post-validation pass is needed
+        return [PGTrigger.from_sql(x[2]) for x in rows]
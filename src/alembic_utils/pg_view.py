@@ -1,6 +1,7 @@
 # pylint: disable=unused-argument,invalid-name,line-too-long
 
 
+import sys
 from typing import Generator
 
 from parse import parse
@@ -15,6 +16,20 @@ from alembic_utils.statement import (
     strip_terminating_semicolon,
 )
 
+_VIEWS_SQL = sql_text(
+    """
+select
+    schemaname schema_name,
+    viewname view_name,
+    definition
+from
+    pg_views
+where
+    schemaname not in ('pg_catalog', 'information_schema')
+    and schemaname::text like :schema;
+"""
+)
+
 
 class PGView(ReplaceableEntity):
     """A PostgreSQL View compatible with `alembic revision --autogenerate`
@@ -29,8 +44,8 @@ class PGView(ReplaceableEntity):
     type_ = "view"
 
     def __init__(self, schema: str, signature: str, definition: str):
-        self.schema: str = coerce_to_unquoted(normalize_whitespace(schema))
-        self.signature: str = coerce_to_unquoted(normalize_whitespace(signature))
+        self.schema: str = sys.intern(coerce_to_unquoted(normalize_whitespace(schema)))
+        self.signature: str = sys.intern(coerce_to_unquoted(normalize_whitespace(signature)))
         self.definition: str = strip_terminating_semicolon(definition)
 
     @classmethod
@@ -85,23 +100,5 @@ class PGView(ReplaceableEntity):
     @classmethod
     def from_database(cls, sess, schema):
         """Get a list of all functions defined in the db"""
-        sql = sql_text(
-            f"""
-        select
-            schemaname schema_name,
-            viewname view_name,
-            definition
-        from
-            pg_views
-        where
-            schemaname not in ('pg_catalog', 'information_schema')
-            and schemaname::text like '{schema}';
-        """
-        )
-        rows = sess.execute(sql).fetchall()
-        db_views = [PGView(x[0], x[1], x[2]) for x in rows]
-
-        for view in db_views:
-            assert view is not None
-
-        return db_views
+        rows = sess.execute(_VIEWS_SQL, {"schema": schema})
+        return [PGView(x[0], x[1], x[2]) for x in rows]
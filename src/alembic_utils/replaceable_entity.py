@@ -1,8 +1,9 @@
 # pylint: disable=unused-argument,invalid-name,line-too-long
 import logging
+import sys
 from itertools import zip_longest
 from pathlib import Path
-from typing import Generator, List, Optional, Set, Type, TypeVar
+from typing import Dict, Generator, List, Optional, Set, Tuple, Type, TypeVar
 
 from alembic.autogenerate import comparators
 from alembic.autogenerate.api import AutogenContext
@@ -41,8 +42,10 @@ class ReplaceableEntity:
     """A SQL Entity that can be replaced"""
 
     def __init__(self, schema: str, signature: str, definition: str):
-        self.schema: str = coerce_to_unquoted(normalize_whitespace(schema))
-        self.signature: str = coerce_to_unquoted(normalize_whitespace(signature))
+        # Schemas and signatures repeat across many entities and comparisons;
+        # interning makes their equality checks a pointer compare
+        self.schema: str = sys.intern(coerce_to_unquoted(normalize_whitespace(schema)))
+        self.signature: str = sys.intern(coerce_to_unquoted(normalize_whitespace(signature)))
         self.definition: str = escape_colon_for_sql(strip_terminating_semicolon(definition))
 
     @property
@@ -140,35 +143,78 @@ class ReplaceableEntity:
         """A string that consistently and globally identifies a function"""
         return f"{self.__class__.__name__}: {self.schema}.{self.signature}"
 
+    _normalized_definition: Optional[str] = None
+
+    def get_normalized_definition(self) -> str:
+        """Whitespace-normalized definition, cached for use as a cheap comparison
+        fingerprint. Definitions are immutable after construction so the cache can
+        never go stale
+        """
+        if self._normalized_definition is None:
+            self._normalized_definition = normalize_whitespace(self.definition)
+        return self._normalized_definition
+
+    _var_name: Optional[str] = None
+
     def to_variable_name(self) -> str:
         """A deterministic variable name based on PGFunction's contents """
-        schema_name = self.schema.lower()
-        object_name = self.signature.split("(")[0].strip().lower().replace("-", "_")
-        return f"{schema_name}_{object_name}"
+        # Cached because render dispatch calls this several times per op
+        if self._var_name is None:
+            schema_name = self.schema.lower()
+            object_name = self.signature.split("(")[0].strip().lower().replace("-", "_")
+            self._var_name = f"{schema_name}_{object_name}"
+        return self._var_name
 
-    _version_to_replace: Optional[T] = None  # type: ignore
+    _version_to_replace: Optional["ReplaceableEntity"] = None
+
+    # Database-rendered copy of self, cached by get_required_migration_op so callers
+    # don't have to re-run the simulation to obtain it
+    _db_rendered: Optional["ReplaceableEntity"] = None
 
     def get_required_migration_op(
-        self: T, sess: Session, dependencies: Optional[List["ReplaceableEntity"]] = None
+        self: T,
+        sess: Session,
+        dependencies: Optional[List["ReplaceableEntity"]] = None,
+        db_entities: Optional[Dict[str, "ReplaceableEntity"]] = None,
     ) -> Optional[ReversibleOp]:
-        """Get the migration operation required for autogenerate"""
-        # All entities in the database for self's schema
-        entities_in_database: List[T] = self.from_database(sess, schema=self.schema)
+        """Get the migration operation required for autogenerate
+
+        *db_entities* optionally maps identity -> entity for the entities already in
+        the database for self's schema so callers comparing many entities can fetch
+        and index the catalog once instead of once per entity
+        """
+        # All entities in the database for self's schema, indexed by identity
+        if db_entities is None:
+            entities_in_database: List["ReplaceableEntity"] = self.from_database(
+                sess, schema=self.schema
+            )
+            db_entities = {x.identity: x for x in entities_in_database}
+
+        # Short-circuit: when the live copy already matches self's definition verbatim
+        # (modulo whitespace) recreating self can not produce a diff, so skip the
+        # simulation round-trips entirely
+        maybe_unchanged: Optional["ReplaceableEntity"] = db_entities.get(self.identity)
+        if (
+            maybe_unchanged is not None
+            and self.get_normalized_definition() == maybe_unchanged.get_normalized_definition()
+        ):
+            self._db_rendered = maybe_unchanged
+            return None
 
         db_def = self.get_database_definition(sess, dependencies=dependencies)
+        self._db_rendered = db_def
+
+        # Hash lookup on identity; only normalize the definitions when identities match
+        maybe_live: Optional["ReplaceableEntity"] = db_entities.get(db_def.identity)
 
-        for x in entities_in_database:
+        if maybe_live is not None:
 
-            if (db_def.identity, normalize_whitespace(db_def.definition)) == (
-                x.identity,
-                normalize_whitespace(x.definition),
-            ):
+            if db_def.get_normalized_definition() == maybe_live.get_normalized_definition():
                 return None
 
-            if db_def.identity == x.identity:
-                # Cache the currently live copy to render a RevertOp without hitting DB again
-                self._version_to_replace = x
-                return ReplaceOp(self)
+            # Cache the currently live copy to render a RevertOp without hitting DB again
+            self._version_to_replace = maybe_live
+            return ReplaceOp(self)
 
         return CreateOp(self)
 
@@ -257,6 +303,14 @@ def register_entities(
         # entities that are receiving a create or update op
         has_create_or_update_op: List[ReplaceableEntity] = []
 
+        # Live database entities indexed by identity, fetched once per (entity class,
+        # schema) and shared across all registered entities so we don't re-query the
+        # catalog per entity. Safe to cache because every comparison below happens in
+        # a rolled back transaction
+        db_entity_cache: Dict[
+            Tuple[Type[ReplaceableEntity], str], Dict[str, ReplaceableEntity]
+        ] = {}
+
         # database rendered definitions for the entities we have a local instance for
         # Note: used for drops
         local_entities = []
@@ -283,13 +337,26 @@ def register_entities(
             transaction = connection.begin_nested()
             sess = Session(bind=connection)
             try:
+                cache_key = (entity.__class__, entity.schema)
+                if cache_key not in db_entity_cache:
+                    live_entities: List[ReplaceableEntity] = entity.from_database(
+                        sess, schema=entity.schema
+                    )
+                    db_entity_cache[cache_key] = {x.identity: x for x in live_entities}
+
                 maybe_op = entity.get_required_migration_op(
-                    sess, dependencies=has_create_or_update_op
+                    sess,
+                    dependencies=has_create_or_update_op,
+                    db_entities=db_entity_cache[cache_key],
                 )
 
-                local_db_def = entity.get_database_definition(
-                    sess, dependencies=has_create_or_update_op
-                )
+                # get_required_migration_op has already simulated the entity and cached
+                # the database-rendered copy; avoid repeating the round-trips
+                local_db_def = entity._db_rendered
+                if local_db_def is None:
+                    local_db_def = entity.get_database_definition(
+                        sess, dependencies=has_create_or_update_op
+                    )
                 local_entities.append(local_db_def)
 
                 if maybe_op:
@@ -135,11 +135,11 @@ def render_replace_entity(autogen_context, op):
 def render_revert_entity(autogen_context, op):
     """Collect the entity definition currently live in the database and use its definition
     as the downgrade revert target"""
-    # At the time is call is made, the engine is disconnected
+    # At the time this call is made, the engine is disconnected
 
     # We should never reach this call unless an update's revert is being rendered
-    # In that case, get_required_migration_op  has cached the database's liver version
-    # as target._version_to_replace
+    # In that case, get_required_migration_op has cached the database's live version
+    # as target._version_to_replace, so no additional round-trip is needed here
 
     target = op.target
     autogen_context.imports.add(target.render_import_statement())
@@ -1,9 +1,13 @@
+import re
 from uuid import uuid4
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 def normalize_whitespace(text, base_whitespace: str = " ") -> str:
     """ Convert all whitespace to *base_whitespace* """
-    return base_whitespace.join(text.split()).strip()
+    # Single C-level pass instead of split() allocating a list of substrings
+    return _WHITESPACE_PATTERN.sub(base_whitespace, text.strip())
 
 
 def strip_terminating_semicolon(sql: str) -> str: